@@ -20,15 +20,32 @@ repository root and adjust ``DATA_DIR`` if necessary. The expected files are:
 Note: Data files are not included in this repository due to publication
 restrictions. When the companion paper is published, the data will be
 added or a link to the source will be provided.
+
+Running the script writes every figure as a PNG to the ``figures`` folder.
 """
 
+import functools
+import multiprocessing
+import sys
+
 import pandas as pd
 import numpy as np
+import matplotlib
+
+if __name__ == "__main__" and not sys.flags.interactive:
+    # Batch runs only write figures to disk, so skip the GUI event loop
+    matplotlib.use("Agg")
+
 import matplotlib.pyplot as plt
 import seaborn as sns
 import matplotlib.dates as mdates
 from pathlib import Path
 
+try:
+    import numba
+except ImportError:  # numba is optional; the NumPy implementation is used instead
+    numba = None
+
 # Configure plotting aesthetics
 sns.set(font_scale=1.1)
 
@@ -38,98 +55,200 @@ sns.set(font_scale=1.1)
 # Directory where data files are stored
 DATA_DIR = Path(__file__).resolve().parent / "data"
 
-# Load dollar price data
-df_dollar = pd.read_csv(DATA_DIR / "dollar_change_columns.csv")
-
-# Load inflation data
-df_inflation = pd.read_excel(DATA_DIR / "Iran_Tavarom.xlsx")
-
-# Rename columns for consistency
-df_dollar = df_dollar.rename(
-    columns={
-        "open": "Open",
-        "low": "Low",
-        "high": "High",
-        "close": "Close",
-        "change": "Change",
-        "persent_change": "ChangePercent",
-        "miladi_date": "MiladiDate",
-        "shamsi_date": "ShamsiDate",
-    }
-)
-
-# Parse dates and set index
-df_dollar["MiladiDate"] = pd.to_datetime(df_dollar["MiladiDate"], errors="coerce")
-df_dollar = df_dollar.set_index("MiladiDate").sort_index()
-
-# Convert numeric columns and handle missing values
-for col in ["Open", "Low", "High", "Close", "Change"]:
-    df_dollar[col] = (
-        df_dollar[col]
-        .replace("-", np.nan)
-        .astype(str)
-        .str.replace(",", "")
-        .astype(float)
+# Cleaned copies of the raw files are cached here as Parquet so repeat runs
+# skip the CSV/Excel parsing and string cleaning. Bump CACHE_VERSION whenever
+# the cleaned layout changes so caches written by older code are not reused.
+CACHE_VERSION = 2
+DOLLAR_CACHE = DATA_DIR / f"dollar_clean.v{CACHE_VERSION}.parquet"
+INFLATION_CACHE = DATA_DIR / f"inflation_clean.v{CACHE_VERSION}.parquet"
+
+
+def _read_cache(cache: Path, source: Path):
+    """Return the cached frame if it is at least as new as its source file.
+
+    Without the source file the cache is used as is. A missing, stale or
+    unreadable cache returns ``None`` so the caller rebuilds it.
+    """
+    if not cache.exists():
+        return None
+    if source.exists() and cache.stat().st_mtime < source.stat().st_mtime:
+        return None
+    try:
+        return pd.read_parquet(cache, engine="pyarrow")
+    except (ImportError, OSError, ValueError):
+        # pyarrow is missing or the file is corrupt (pyarrow's ArrowInvalid is
+        # a ValueError); the rebuilt frame overwrites it
+        return None
+
+
+def _write_cache(df: pd.DataFrame, cache: Path) -> None:
+    try:
+        df.to_parquet(cache, engine="pyarrow")
+    except (ImportError, OSError, TypeError, ValueError):
+        # The cache is only an optimisation: without pyarrow, with a read-only
+        # data folder or with columns pyarrow cannot convert (ArrowTypeError
+        # and ArrowInvalid are TypeError/ValueError), every run parses the raw
+        # files instead
+        pass
+
+
+def load_dollar() -> pd.DataFrame:
+    """Load and clean the daily dollar price data."""
+    source = DATA_DIR / "dollar_change_columns.csv"
+    df = _read_cache(DOLLAR_CACHE, source)
+    if df is not None:
+        return df
+
+    df = pd.read_csv(source)
+
+    # Rename columns for consistency
+    df = df.rename(
+        columns={
+            "open": "Open",
+            "low": "Low",
+            "high": "High",
+            "close": "Close",
+            "change": "Change",
+            "persent_change": "ChangePercent",
+            "miladi_date": "MiladiDate",
+            "shamsi_date": "ShamsiDate",
+        }
+    )
+
+    # Parse dates and set index
+    raw_dates = df["MiladiDate"]
+    dates = pd.to_datetime(raw_dates, format="%Y-%m-%d", errors="coerce", cache=True)
+    # Dates in any other layout fall back to the inferring parser
+    missed = dates.isna() & raw_dates.notna()
+    if missed.any():
+        dates[missed] = pd.to_datetime(raw_dates[missed], errors="coerce", cache=True)
+    df["MiladiDate"] = dates
+    df = df.set_index("MiladiDate")
+    # Rows whose date could not be parsed cannot be placed in time, and a NaT
+    # in the index would break the binary search in build_monthly
+    df = df[df.index.notna()]
+    # The export is normally already in date order; only sort when it is not
+    if not df.index.is_monotonic_increasing:
+        df = df.sort_index()
+
+    # Convert numeric columns in one pass; "-" placeholders become NaN. Rial
+    # prices fit comfortably in float32, which halves downstream memory traffic.
+    cols = ["Open", "Low", "High", "Close", "Change"]
+    arr = np.char.replace(df[cols].to_numpy(dtype=str), ",", "")
+    arr[arr == "-"] = "nan"
+    # Keep the numeric columns as one column-major block so each column is
+    # contiguous in memory and pandas does not split it into per-column blocks
+    block = arr.astype(np.float32, order="F")
+    df = pd.concat(
+        [pd.DataFrame(block, index=df.index, columns=cols, copy=False), df.drop(columns=cols)],
+        axis=1,
     )
 
+    _write_cache(df, DOLLAR_CACHE)
+    return df
+
+
+def load_inflation() -> pd.DataFrame:
+    """Load the annual inflation rates."""
+    source = DATA_DIR / "Iran_Tavarom.xlsx"
+    df = _read_cache(INFLATION_CACHE, source)
+    if df is not None:
+        return df
+
+    df = pd.read_excel(source, engine="openpyxl")
+    _write_cache(df, INFLATION_CACHE)
+    return df
+
+
 # ---------------------------------------------------------------------------
 # 2. Extract 12‑month buy and sell prices
 # ---------------------------------------------------------------------------
-monthly = df_dollar.copy()
-monthly["BuyPrice"] = monthly["Close"].resample("M").last()
-monthly["BuyDate"] = monthly.index
-monthly["SellDate"] = monthly["BuyDate"] + pd.DateOffset(months=12)
-monthly = monthly.dropna(subset=["BuyPrice", "SellDate"])
-
-# Prepare sell prices (nearest date to SellDate)
-df_prices = df_dollar[["Close"]].rename(columns={"Close": "SellPrice"})
-df_prices["Date"] = df_prices.index
-
-monthly = pd.merge_asof(
-    monthly.sort_values("SellDate"),
-    df_prices.sort_values("Date"),
-    left_on="SellDate",
-    right_on="Date",
-    direction="nearest",
-)
-
-monthly["SellPriceDate"] = monthly["Date"]
-monthly = monthly.drop(columns=["Date"])
+def build_monthly(df_dollar: pd.DataFrame) -> pd.DataFrame:
+    """Pair each month-end buy price with the close 12 months later."""
+    monthly = df_dollar["Close"].resample("M").last().rename("BuyPrice").to_frame()
+    monthly = monthly.dropna(subset=["BuyPrice"])
+    monthly["BuyDate"] = monthly.index
+    # Offsetting the DatetimeIndex itself is applied in one vectorized step
+    sell_dates = monthly.index + pd.DateOffset(years=1)
+    monthly["SellDate"] = sell_dates
+
+    # Sell prices: closing price on the trading day nearest to SellDate. Both
+    # the daily index and sell_dates are already sorted, so a binary search
+    # plus a comparison with the left neighbour finds it without any further
+    # sorting (ties go to the earlier day).
+    idx_i8 = df_dollar.index.asi8
+    sell_i8 = sell_dates.asi8
+    pos = np.searchsorted(idx_i8, sell_i8)
+    pos_l = np.clip(pos - 1, 0, len(idx_i8) - 1)
+    pos_r = np.clip(pos, 0, len(idx_i8) - 1)
+    pick_r = np.abs(idx_i8[pos_r] - sell_i8) < np.abs(idx_i8[pos_l] - sell_i8)
+    chosen = np.where(pick_r, pos_r, pos_l)
+
+    monthly["SellPrice"] = df_dollar["Close"].to_numpy()[chosen]
+    monthly["SellPriceDate"] = df_dollar.index[chosen]
+    return monthly
+
 
 # ---------------------------------------------------------------------------
 # 3. Nominal and real gain calculations
 # ---------------------------------------------------------------------------
-monthly["GainNominal"] = monthly["SellPrice"] - monthly["BuyPrice"]
-monthly["BuyYear"] = monthly["BuyDate"].dt.year
+@functools.cache
+def load_data() -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+    """Load and prepare the inputs once per process.
+
+    Returns ``(df_dollar, df_final, df_inflation)``: the cleaned daily prices,
+    the monthly holding periods with nominal and real gains, and the annual
+    inflation rates keyed by ``BuyYear``.
+    """
+    df_dollar = load_dollar()
+    df_inflation = load_inflation()
+
+    monthly = build_monthly(df_dollar)
+    monthly["GainNominal"] = monthly["SellPrice"] - monthly["BuyPrice"]
+    monthly["BuyYear"] = monthly["BuyDate"].dt.year.astype(np.int16)
+
+    df_inflation = df_inflation.rename(
+        columns={"year_miladi": "BuyYear", "persent": "InflationRate"}
+    )
+    # Blank or note rows in the sheet have no year and could never match a
+    # buy year, so drop them before the integer cast
+    df_inflation = df_inflation.dropna(subset=["BuyYear"]).astype({"BuyYear": np.int16})
+    df_final = pd.merge(monthly, df_inflation, on="BuyYear", how="left")
+    df_final["GainReal"] = df_final["GainNominal"] / (1 + df_final["InflationRate"] / 100)
+    return df_dollar, df_final, df_inflation
+
+
+@functools.cache
+def gain_real_by_year() -> pd.Series:
+    """Average real gain per buy year, shared by every scenario run."""
+    df_final = load_data()[1]
+    return df_final.groupby("BuyYear", observed=True, sort=False)["GainReal"].mean()
 
-df_inflation = df_inflation.rename(
-    columns={"year_miladi": "BuyYear", "persent": "InflationRate"}
-)
-df_all = pd.merge(monthly, df_inflation, on="BuyYear", how="left")
-df_all["GainReal"] = df_all["GainNominal"] / (1 + df_all["InflationRate"] / 100)
-df_final = df_all.copy()
 
 # ---------------------------------------------------------------------------
 # 4. Basic analysis plots
 # ---------------------------------------------------------------------------
-def plot_price_trend():
-    plt.figure(figsize=(12, 5))
-    plt.plot(df_dollar.index, df_dollar["Close"], color="royalblue")
+# Directory where figures are written
+FIGURES_DIR = Path(__file__).resolve().parent / "figures"
+
+
+def plot_price_trend(df_dollar: pd.DataFrame) -> plt.Figure:
+    fig, ax = plt.subplots(figsize=(12, 5))
+    ax.plot(df_dollar.index, df_dollar["Close"], color="royalblue")
     plt.title("روند قیمت بسته‌ شدن دلار")
     plt.xlabel("تاریخ")
     plt.ylabel("قیمت (ریال)")
     plt.xticks(rotation=45)
     plt.tight_layout()
     plt.grid(True)
-    plt.show()
+    return fig
 
 
-def plot_nominal_gain():
-    plt.figure(figsize=(12, 5))
-    sns.lineplot(
-        data=df_final,
-        x="SellDate",
-        y="GainNominal",
+def plot_nominal_gain(df_final: pd.DataFrame) -> plt.Figure:
+    fig, ax = plt.subplots(figsize=(12, 5))
+    ax.plot(
+        df_final["SellDate"].to_numpy(),
+        df_final["GainNominal"].to_numpy(),
         marker="o",
         color="darkorange",
     )
@@ -138,12 +257,12 @@ def plot_nominal_gain():
     plt.ylabel("سود اسمی (ریال)")
     plt.xticks(rotation=45)
     plt.tight_layout()
-    plt.show()
+    return fig
 
 
-def plot_real_gain_distribution():
-    plt.figure(figsize=(12, 5))
-    ax = sns.histplot(df_final["GainReal"], bins=30, kde=True, color="seagreen")
+def plot_real_gain_distribution(df_final: pd.DataFrame) -> plt.Figure:
+    fig, ax = plt.subplots(figsize=(12, 5))
+    sns.histplot(df_final["GainReal"], bins=30, kde=True, color="seagreen", ax=ax)
     for patch in ax.patches:
         height = patch.get_height()
         if height > 0:
@@ -158,26 +277,18 @@ def plot_real_gain_distribution():
     plt.xlabel("سود واقعی (ریال)")
     plt.ylabel("تعداد معاملات")
     plt.tight_layout()
-    plt.show()
+    return fig
 
 
-def plot_buy_sell_comparison():
+def plot_buy_sell_comparison(df_final: pd.DataFrame) -> plt.Figure:
     fig, ax = plt.subplots(figsize=(14, 5))
-    sns.lineplot(
-        data=df_final,
-        x="BuyDate",
-        y="BuyPrice",
-        label="قیمت خرید",
-        color="orange",
-        ax=ax,
-    )
-    sns.lineplot(
-        data=df_final,
-        x="BuyDate",
-        y="SellPrice",
+    buy_dates = df_final["BuyDate"].to_numpy()
+    ax.plot(buy_dates, df_final["BuyPrice"].to_numpy(), label="قیمت خرید", color="orange")
+    ax.plot(
+        buy_dates,
+        df_final["SellPrice"].to_numpy(),
         label="قیمت فروش (۱۲ ماه بعد)",
         color="green",
-        ax=ax,
     )
     ax.xaxis.set_major_locator(mdates.YearLocator())
     ax.xaxis.set_major_formatter(mdates.DateFormatter("%Y"))
@@ -186,16 +297,33 @@ def plot_buy_sell_comparison():
     plt.ylabel("قیمت (ریال)")
     plt.legend()
     plt.tight_layout()
-    plt.show()
-
-
-def plot_gain_by_year():
-    df_grouped = df_final.groupby("BuyYear")[["GainNominal", "GainReal"]].mean().reset_index()
-    plt.figure(figsize=(12, 5))
-    plt.plot(df_grouped["BuyYear"], df_grouped["GainNominal"], marker="o", label="سود اسمی")
-    plt.plot(
-        df_grouped["BuyYear"],
-        df_grouped["GainReal"],
+    return fig
+
+
+def _mean_by_group(keys: np.ndarray, values: np.ndarray):
+    """Return the sorted unique ``keys`` and the NaN-skipping column means of
+    ``values`` (shape ``(n, k)``) for each key."""
+    order = np.argsort(keys, kind="stable")
+    keys_s = keys[order]
+    values_s = values[order]
+    bounds = np.flatnonzero(np.r_[True, keys_s[1:] != keys_s[:-1]])
+    valid = ~np.isnan(values_s)
+    sums = np.add.reduceat(np.where(valid, values_s, 0), bounds, axis=0)
+    counts = np.add.reduceat(valid, bounds, axis=0)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return keys_s[bounds], sums / counts
+
+
+def plot_gain_by_year(df_final: pd.DataFrame) -> plt.Figure:
+    years, means = _mean_by_group(
+        df_final["BuyYear"].to_numpy(),
+        df_final[["GainNominal", "GainReal"]].to_numpy(dtype=np.float64),
+    )
+    fig, ax = plt.subplots(figsize=(12, 5))
+    ax.plot(years, means[:, 0], marker="o", label="سود اسمی")
+    ax.plot(
+        years,
+        means[:, 1],
         marker="s",
         linestyle="--",
         label="سود واقعی",
@@ -205,94 +333,193 @@ def plot_gain_by_year():
     plt.ylabel("مقدار سود (ریال)")
     plt.legend()
     plt.tight_layout()
-    plt.show()
+    return fig
 
 
 # ---------------------------------------------------------------------------
 # 5. Define tiered CGT function
 # ---------------------------------------------------------------------------
-def calculate_cgt_plakani(amount: float) -> float:
-    """Calculate tiered capital‑gains tax based on a stepped rate structure."""
+def calculate_cgt_plakani(amount: np.ndarray) -> np.ndarray:
+    """Calculate tiered capital‑gains tax based on a stepped rate structure.
+
+    Accepts a scalar or an array of gains and evaluates every element at once.
+    """
+    amount = np.asarray(amount, dtype=float)
+    return np.select(
+        [amount <= 50_000_000, amount <= 100_000_000],
+        [
+            amount * 0.15,
+            (50_000_000 * 0.15) + ((amount - 50_000_000) * 0.20),
+        ],
+        default=(
+            (50_000_000 * 0.15)
+            + (50_000_000 * 0.20)
+            + ((amount - 100_000_000) * 0.25)
+        ),
+    )
+
+
+def _cgt_tiers(amount: float) -> float:
+    """Scalar tiered CGT, compiled into the scenario kernel when numba is available."""
     if amount <= 50_000_000:
         return amount * 0.15
     elif amount <= 100_000_000:
-        return (50_000_000 * 0.15) + ((amount - 50_000_000) * 0.20)
+        return 7_500_000 + (amount - 50_000_000) * 0.20
     else:
-        return (
-            (50_000_000 * 0.15)
-            + (50_000_000 * 0.20)
-            + ((amount - 100_000_000) * 0.25)
-        )
+        return 17_500_000 + (amount - 100_000_000) * 0.25
 
 
 # ---------------------------------------------------------------------------
 # 6. Scenario simulation and sensitivity analysis
 # ---------------------------------------------------------------------------
+# Grids smaller than this use the NumPy broadcast; compiling the numba kernel
+# only pays off for large sensitivity sweeps
+KERNEL_MIN_CELLS = 100_000
+
+if numba is not None:
+    _cgt_tiers_jit = numba.njit(cache=True)(_cgt_tiers)
+
+    # Compiled serially so no numba thread pool is left running in a process
+    # that later forks the figure workers
+    @numba.njit(cache=True)
+    def _scenario_kernel(gain_real, dollar_rate, volume, people, rates, out_gain, out_tax, out_total):
+        n_scenarios = len(volume)
+        n_rates = len(rates)
+        for i in range(len(gain_real) * n_scenarios * n_rates):
+            y = i // (n_scenarios * n_rates)
+            s = (i // n_rates) % n_scenarios
+            r = i % n_rates
+            gain = gain_real[y] / dollar_rate[y] * volume[s]
+            tax = _cgt_tiers_jit(gain)
+            out_gain[i] = gain
+            out_tax[i] = tax
+            out_total[i] = tax * people[s] * rates[r]
+
+
+def scenario_grid(gain_real, dollar_rate, volume, people, rates):
+    """Evaluate per-person gain, per-person tax and total tax on the full
+    (year, scenario, rate) grid.
+
+    ``gain_real`` and ``dollar_rate`` are indexed by year, ``volume`` and
+    ``people`` by scenario. The three results are flat float64 arrays in
+    (year, scenario, rate) order, so large sensitivity sweeps can use them
+    without going through a DataFrame. Grids of at least ``KERNEL_MIN_CELLS``
+    cells run in a compiled numba loop when numba is installed.
+    """
+    gain_real, dollar_rate, volume, people, rates = (
+        np.ascontiguousarray(arr, dtype=np.float64)
+        for arr in (gain_real, dollar_rate, volume, people, rates)
+    )
+    size = len(gain_real) * len(volume) * len(rates)
+    if numba is not None and size >= KERNEL_MIN_CELLS:
+        out_gain = np.empty(size)
+        out_tax = np.empty(size)
+        out_total = np.empty(size)
+        _scenario_kernel(gain_real, dollar_rate, volume, people, rates, out_gain, out_tax, out_total)
+        return out_gain, out_tax, out_total
+
+    # NumPy path: broadcast over (year, scenario, rate)
+    shape = (len(gain_real), len(volume), len(rates))
+    gain_person = (gain_real / dollar_rate)[:, None, None] * volume[None, :, None]
+    tax_person = calculate_cgt_plakani(gain_person)
+    total_tax = tax_person * people[None, :, None] * rates[None, None, :]
+    return (
+        np.broadcast_to(gain_person, shape).ravel(),
+        np.broadcast_to(tax_person, shape).ravel(),
+        total_tax.ravel(),
+    )
+
+
 def run_scenarios():
-    scenarios = {
-        "محافظه‌کارانه": {"people": 850_000, "volume": 2_000},
-        "میانه": {"people": 4_250_000, "volume": 5_000},
-        "خوش‌بینانه": {"people": 8_500_000, "volume": 10_000},
-    }
-    realization_rates = [0.5, 0.7, 0.9]
-    yearly_dollar_rate = {2020: 20000, 2021: 25000, 2022: 30000, 2023: 40000, 2024: 50000}
-    gain_real_avg_by_year = df_final.groupby("BuyYear")["GainReal"].mean().to_dict()
-
-    results = []
-    for year in range(2020, 2025):
-        for scenario_name, scenario in scenarios.items():
-            for rate in realization_rates:
-                gain_real = gain_real_avg_by_year.get(year, np.nan)
-                if np.isnan(gain_real):
-                    continue
-                dollar_value = yearly_dollar_rate[year]
-                dollar_volume = scenario["volume"]
-                people = scenario["people"]
-
-                gain_person = gain_real / dollar_value * dollar_volume
-                tax_person = calculate_cgt_plakani(gain_person)
-                total_tax = tax_person * people * rate
-
-                results.append(
-                    {
-                        "سال": year,
-                        "سناریو": scenario_name,
-                        "نرخ تحقق": f"{int(rate * 100)}%",
-                        "تعداد افراد": people,
-                        "حجم دلاری فرد": dollar_volume,
-                        "سود واقعی هر نفر (ریال)": round(gain_person),
-                        "مالیات هر نفر (ریال)": round(tax_person),
-                        "کل مالیات دولت (ریال)": round(total_tax),
-                    }
-                )
-    return pd.DataFrame(results)
-
-
-def plot_cgt_summary(df_summary: pd.DataFrame) -> None:
-    plt.figure(figsize=(14, 6))
-    sns.barplot(
-        data=df_summary,
-        x="سال",
-        y="کل مالیات دولت (ریال)",
-        hue="سناریو",
-        ci=None,
+    scenario_names = ["محافظه‌کارانه", "میانه", "خوش‌بینانه"]
+    people = np.array([850_000, 4_250_000, 8_500_000])
+    volume = np.array([2_000, 5_000, 10_000])
+    rates = np.array([0.5, 0.7, 0.9])
+    rate_labels = np.array([f"{int(rate * 100)}%" for rate in rates])
+    years = np.arange(2020, 2025)
+    dollar_rate = np.array([20000, 25000, 30000, 40000, 50000])
+    gain_real = gain_real_by_year().reindex(years).to_numpy()
+
+    gain_person, tax_person, total_tax = scenario_grid(gain_real, dollar_rate, volume, people, rates)
+
+    year_idx, scenario_idx, rate_idx = (
+        grid.ravel() for grid in np.meshgrid(
+            np.arange(len(years)),
+            np.arange(len(volume)),
+            np.arange(len(rates)),
+            indexing="ij",
+        )
     )
+    # Years without an average real gain are left out of the results
+    keep = ~np.isnan(gain_real[year_idx])
+    year_idx, scenario_idx, rate_idx = year_idx[keep], scenario_idx[keep], rate_idx[keep]
+
+    return pd.DataFrame(
+        {
+            "سال": years[year_idx],
+            "سناریو": pd.Categorical.from_codes(scenario_idx, categories=scenario_names),
+            "نرخ تحقق": rate_labels[rate_idx],
+            "تعداد افراد": people[scenario_idx],
+            "حجم دلاری فرد": volume[scenario_idx],
+            "سود واقعی هر نفر (ریال)": np.round(gain_person[keep]).astype(np.int64),
+            "مالیات هر نفر (ریال)": np.round(tax_person[keep]).astype(np.int64),
+            "کل مالیات دولت (ریال)": np.round(total_tax[keep]).astype(np.int64),
+        }
+    )
+
+
+def plot_cgt_summary(df_summary: pd.DataFrame) -> plt.Figure:
+    # Mean total revenue per (year, scenario) across realization rates
+    piv = df_summary.pivot_table(
+        index="سال",
+        columns="سناریو",
+        values="کل مالیات دولت (ریال)",
+        aggfunc="mean",
+        observed=True,
+    )
+    fig, ax = plt.subplots(figsize=(14, 6))
+    piv.plot.bar(ax=ax, rot=0)
     plt.title("درآمد CGT دولت از معاملات دلار در سناریوهای مختلف")
     plt.xlabel("سال")
     plt.ylabel("کل درآمد مالیاتی (ریال)")
     plt.legend(title="سناریو")
     plt.tight_layout()
-    plt.show()
+    return fig
+
+
+@functools.cache
+def _plot_input(source: str) -> pd.DataFrame:
+    """Build the frame a plot draws from, only when a task asks for it."""
+    if source == "df_summary":
+        return run_scenarios()
+    df_dollar, df_final, _ = load_data()
+    return {"df_dollar": df_dollar, "df_final": df_final}[source]
+
+
+def _run_plot(task) -> None:
+    """Draw one figure in a worker process and save it as a PNG."""
+    matplotlib.use("Agg")
+    name, plot, source = task
+    fig = plot(_plot_input(source))
+    fig.savefig(FIGURES_DIR / f"{name}.png", dpi=120)
+    plt.close(fig)
 
 
 if __name__ == "__main__":
-    # Generate basic plots
-    plot_price_trend()
-    plot_nominal_gain()
-    plot_real_gain_distribution()
-    plot_buy_sell_comparison()
-    plot_gain_by_year()
-
-    # Run scenario analysis and plot summary
-    summary_df = run_scenarios()
-    plot_cgt_summary(summary_df)
\ No newline at end of file
+    # Load the data once so forked workers inherit it; spawned ones reload it
+    # from the Parquet cache. The scenario analysis only runs in the worker
+    # that draws the CGT summary.
+    load_data()
+
+    # The figures are independent, so each one is rendered in its own process
+    plots = [
+        ("price_trend", plot_price_trend, "df_dollar"),
+        ("nominal_gain", plot_nominal_gain, "df_final"),
+        ("real_gain_distribution", plot_real_gain_distribution, "df_final"),
+        ("buy_sell_comparison", plot_buy_sell_comparison, "df_final"),
+        ("gain_by_year", plot_gain_by_year, "df_final"),
+        ("cgt_summary", plot_cgt_summary, "df_summary"),
+    ]
+    FIGURES_DIR.mkdir(exist_ok=True)
+    with multiprocessing.Pool(len(plots)) as pool:
+        pool.map(_run_plot, plots)